@@ -1,26 +1,89 @@
+import copy
 import json
 import re
-
-
-def _extract_from_app_init_state(html_content):
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # Optional: much faster parsing of the large APP_INITIALIZATION_STATE blob
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: SIMD hashing of the page bytes for the result cache key
+except ImportError:
+    xxhash = None
+
+# --- Precompiled patterns ---
+# HTML is scanned as UTF-8 bytes (all anchors are ASCII); only captured groups are decoded
+_APP_INIT_START = b';window.APP_INITIALIZATION_STATE'
+_APP_INIT_END = b';window.APP_FLAGS'
+# A page containing neither is not a place page (see _looks_like_place_page)
+_APP_INIT_PROBE = b'APP_INITIALIZATION_STATE'
+_RATING_PROBE = b'fontDisplayMedium'
+_RE_H1 = re.compile(rb'<h1[^>]*>(.*?)</h1>', re.DOTALL)
+_RE_RATING = re.compile(rb'class="fontDisplayMedium">([\d.]+)</div>')
+_RE_REVIEWS = re.compile(rb'fontDisplayMedium">[\d.]+<.*?>([\d,]+)\s+reviews?', re.DOTALL)
+_RE_ADDR_DATA = re.compile(rb'data-item-id="address"[^>]*aria-label="(.*?)"')
+# Up to 50 characters, i.e. at most 200 UTF-8 bytes; the char length is checked after decoding
+_RE_SPAN = re.compile(rb'<span[^>]*>([^<]{2,200})</span>')
+# Patterns applied to already decoded text
+_RE_NON_DIGIT = re.compile(r'\D')
+_RE_DOMAIN = re.compile(r'([\w][\w.-]+\.\w{2,})')
+# Place URL tokens: !1s<hex feature id> and !3d<lat>!4d<lng>
+_RE_LINK_PLACE_ID = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)')
+_RE_LINK_COORDS = re.compile(r'!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)')
+
+# Span texts after the h1 that are never the category (separators, price levels)
+_CATEGORY_NOISE = frozenset({'\u00b7', '$', '$$', '$$$', '$$$$'})
+# Thousands separators deleted from review counts
+_THOUSANDS_SEPARATORS = b',.'
+# Deletes the punctuation that may surround rating / review numbers
+_NUMERIC_PUNCTUATION = str.maketrans('', '', '.,()')
+REVIEWS_WINDOW = 2000  # Max bytes after the rating searched for the review count
+CATEGORIES_WINDOW = 3000  # Max bytes after the h1 searched for the category span
+DETAILS_WINDOW = 200_000  # Max bytes after the h1 scanned for the other place details
+
+# (captured bytes, end offset) of a field found by the anchor scan, keyed by field
+_Capture = Tuple[bytes, int]
+_Matches = Dict[str, _Capture]
+_Parser = Callable[[bytes, int, int], Optional[_Capture]]
+_AnchorField = Tuple[str, _Parser, int, Optional[int]]
+
+# Results of recent extractions, keyed by a 64-bit hash of the page bytes (LRU)
+RESULT_CACHE_SIZE = 256
+_result_cache: 'OrderedDict[Tuple[int, Optional[str]], Optional[Dict[str, Any]]]' = OrderedDict()
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parses JSON text (str or bytes) with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _extract_from_app_init_state(html_content: bytes) -> Dict[str, Any]:
     """
     Extracts place_id, coordinates, and name from window.APP_INITIALIZATION_STATE.
     Google still embeds minimal place info here even though full details moved to rendered HTML.
     """
-    result = {}
+    result: Dict[str, Any] = {}
     try:
-        match = re.search(
-            r';window\.APP_INITIALIZATION_STATE\s*=\s*(.*?);window\.APP_FLAGS',
-            html_content, re.DOTALL
-        )
-        if not match:
+        # Plain substring scans on the fixed anchors; no regex over the whole document
+        start = html_content.find(_APP_INIT_START)
+        if start < 0:
+            return result
+        start = html_content.find(b'=', start + len(_APP_INIT_START)) + 1
+        end = html_content.find(_APP_INIT_END, start)
+        if start <= 0 or end < 0:
             return result
 
-        json_str = match.group(1).strip()
-        if not json_str.startswith(('[', '{')):
+        json_str = html_content[start:end].strip()
+        if not json_str.startswith((b'[', b'{')):
             return result
 
-        initial_data = json.loads(json_str)
+        initial_data = _json_loads(json_str)
 
         # New structure (2025+): place data at [5][3][2]
         if (isinstance(initial_data, list) and len(initial_data) > 5
@@ -52,35 +115,60 @@ def _extract_from_app_init_state(html_content):
     return result
 
 
-def _extract_legacy_blob(blob, result):
+def _legacy_item(index: int) -> Callable[[Any], Any]:
+    """Returns a getter for value[index] of a nested list (None if missing)."""
+    def get(value: Any) -> Any:
+        return value[index] if isinstance(value, list) and len(value) > index else None
+    return get
+
+
+def _legacy_coordinates(value: Any) -> Optional[Dict[str, Any]]:
+    """Builds the coordinates dict from a [null, null, lat, lng] list."""
+    if isinstance(value, list) and len(value) > 3:
+        lat, lng = value[2], value[3]
+        if isinstance(lat, (int, float)) and isinstance(lng, (int, float)):
+            return {"latitude": lat, "longitude": lng}
+    return None
+
+
+def _legacy_address(value: Any) -> Optional[str]:
+    """Joins the non-empty address lines."""
+    if isinstance(value, list):
+        return ", ".join(filter(None, value))
+    return None
+
+
+# Legacy [3][6] blob: (index, result key, transform of blob[index] or None), in lookup order.
+# Falsy values are skipped.
+_LEGACY_BLOB_FIELDS: Tuple[Tuple[int, str, Optional[Callable[[Any], Any]]], ...] = (
+    (11, 'name', None),
+    (10, 'place_id', None),
+    (9, 'coordinates', _legacy_coordinates),
+    (4, 'rating', _legacy_item(7)),
+    (4, 'reviews_count', _legacy_item(8)),
+    (7, 'website', _legacy_item(0)),
+    (2, 'address', _legacy_address),
+    (13, 'categories', None),
+)
+
+
+def _extract_legacy_blob(blob: List[Any], result: Dict[str, Any]) -> None:
     """Try to extract data from the legacy [3][6] list structure."""
     try:
-        if len(blob) > 11 and blob[11]:
-            result.setdefault('name', blob[11])
-        if len(blob) > 10 and blob[10]:
-            result.setdefault('place_id', blob[10])
-        if len(blob) > 9 and isinstance(blob[9], list) and len(blob[9]) > 3:
-            lat, lng = blob[9][2], blob[9][3]
-            if isinstance(lat, (int, float)) and isinstance(lng, (int, float)):
-                result.setdefault('coordinates', {"latitude": lat, "longitude": lng})
-        if len(blob) > 4 and isinstance(blob[4], list):
-            if len(blob[4]) > 7 and blob[4][7]:
-                result.setdefault('rating', blob[4][7])
-            if len(blob[4]) > 8 and blob[4][8]:
-                result.setdefault('reviews_count', blob[4][8])
-        if len(blob) > 7 and isinstance(blob[7], list) and blob[7]:
-            result.setdefault('website', blob[7][0])
-        if len(blob) > 2 and isinstance(blob[2], list):
-            addr = ", ".join(filter(None, blob[2]))
-            if addr:
-                result.setdefault('address', addr)
-        if len(blob) > 13 and blob[13]:
-            result.setdefault('categories', blob[13])
+        size = len(blob)
+        for index, key, transform in _LEGACY_BLOB_FIELDS:
+            if index >= size:
+                continue
+            value = blob[index]
+            if transform is not None:
+                value = transform(value)
+            if value:
+                result.setdefault(key, value)
     except Exception:
         pass
 
 
-def _try_parse_legacy_string(blob_str, result):
+def _try_parse_legacy_string(blob_str: str, result: Dict[str, Any]) -> None:
     """Try to parse the legacy string format at [3][6]."""
     try:
         inner_str = blob_str
@@ -92,61 +180,210 @@ def _try_parse_legacy_string(blob_str, result):
         # Try to parse as JSON
         inner_str = inner_str.strip()
         if inner_str.startswith(('[', '{')):
-            parsed = json.loads(inner_str)
+            parsed = _json_loads(inner_str)
             if isinstance(parsed, list) and len(parsed) > 6 and isinstance(parsed[6], list):
                 _extract_legacy_blob(parsed[6], result)
     except (json.JSONDecodeError, Exception):
         pass
 
 
-def _extract_name(html_content):
+def _decode(raw: bytes) -> str:
+    """Decodes a captured UTF-8 byte group."""
+    return raw.decode('utf-8', 'replace')
+
+
+def _strip_tags(raw: bytes) -> bytes:
+    """Removes <...> tags from a short byte string (same result as re.sub(rb'<[^>]+>', b'', raw))."""
+    parts: List[bytes] = []
+    pos = 0
+    while True:
+        lt = raw.find(b'<', pos)
+        if lt < 0:
+            parts.append(raw[pos:])
+            break
+        gt = raw.find(b'>', lt + 1)
+        if gt < 0:
+            parts.append(raw[pos:])
+            break
+        if gt == lt + 1:
+            # "<>" is not a tag
+            parts.append(raw[pos:lt + 1])
+            pos = lt + 1
+            continue
+        parts.append(raw[pos:lt])
+        pos = gt + 1
+    return b''.join(parts)
+
+
+def _regex_parser(pattern: Any) -> _Parser:
+    """Wraps a field pattern as an anchor parser returning (group 1, end offset)."""
+    def parse(html_content: bytes, pos: int, endpos: int) -> Optional[_Capture]:
+        match = pattern.match(html_content, pos, endpos)
+        return (match.group(1), match.end()) if match else None
+    return parse
+
+
+def _label_parser(prefix: bytes) -> _Parser:
+    """
+    Parser for `<prefix>\\s*(.*?)\\s*"` using bytes.find: the value runs up to the next
+    quote and may not contain a line break (other than surrounding whitespace).
+    """
+    def parse(html_content: bytes, pos: int, endpos: int) -> Optional[_Capture]:
+        start = pos + len(prefix)
+        quote = html_content.find(b'"', start, endpos)
+        if quote < 0:
+            return None
+        value = html_content[start:quote]
+        if b'\n' in value.strip():
+            return None
+        return value, quote + 1
+    return parse
+
+
+def _parse_phone_tel(html_content: bytes, pos: int, endpos: int) -> Optional[_Capture]:
+    """Parser for `data-item-id="phone:tel:(\\d+)"` using bytes.find."""
+    start = pos + len(b'data-item-id="phone:tel:')
+    quote = html_content.find(b'"', start, endpos)
+    if quote < 0:
+        return None
+    digits = html_content[start:quote]
+    return (digits, quote + 1) if digits.isdigit() else None
+
+
+def _parse_web_data(html_content: bytes, pos: int, endpos: int) -> Optional[_Capture]:
+    """
+    Parser for `data-item-id="authority"[^>]*aria-label="[^"]*?([\w][\w.-]+\.\w{2,})`.
+    The label is decoded before the domain is matched, so \w means a Unicode word
+    character as in the str pattern (marks such as U+200E around the domain are skipped).
+    """
+    start = pos + len(b'data-item-id="authority"')
+    tag_end = html_content.find(b'>', start, endpos)
+    search_end = endpos if tag_end < 0 else tag_end
+    # [^>]* is greedy, so the last aria-label of the tag is tried first
+    while True:
+        label = html_content.rfind(b'aria-label="', start, search_end)
+        if label < 0:
+            return None
+        value_start = label + len(b'aria-label="')
+        quote = html_content.find(b'"', value_start, endpos)
+        value_end = endpos if quote < 0 else quote
+        match = _RE_DOMAIN.search(_decode(html_content[value_start:value_end]))
+        if match:
+            return match.group(1).encode('utf-8'), value_end
+        search_end = label
+
+
+# Literal anchor -> ((field key, parser, bytes the field starts before the anchor,
+#                     max bytes the parser may scan from the anchor or None), ...)
+# Primary fields come first, so the fallback anchors are not searched once the scan settles
+_ANCHORS: Tuple[Tuple[bytes, Tuple[_AnchorField, ...]], ...] = (
+    (b'<h1', (('h1', _regex_parser(_RE_H1), 0, None),)),
+    (b'fontDisplayMedium">', (('rating', _regex_parser(_RE_RATING), len(b'class="'), None),
+                              ('reviews', _regex_parser(_RE_REVIEWS), 0, REVIEWS_WINDOW))),
+    (b'aria-label="Address:', (('addr_aria', _label_parser(b'aria-label="Address:'), 0, None),)),
+    (b'aria-label="Website:', (('web_aria', _label_parser(b'aria-label="Website:'), 0, None),)),
+    (b'data-item-id="phone:tel:', (('phone_tel', _parse_phone_tel, 0, None),)),
+    (b'data-item-id="address"', (('addr_data', _regex_parser(_RE_ADDR_DATA), 0, None),)),
+    (b'data-item-id="authority"', (('web_data', _parse_web_data, 0, None),)),
+    (b'aria-label="Phone:', (('phone_aria', _label_parser(b'aria-label="Phone:'), 0, None),)),
+)
+# Once these are found the fallback fields can no longer change the result
+_PRIMARY_FIELDS = frozenset({'h1', 'rating', 'reviews', 'addr_aria', 'web_aria', 'phone_tel'})
+
+
+def _scan_settled(matches: _Matches) -> bool:
+    """Tells whether anchors further down can no longer change any extracted field."""
+    if not _PRIMARY_FIELDS.issubset(matches):
+        return False
+    # An empty "Website:" label still falls back to the authority link
+    return bool(matches['web_aria'][0].strip()) or 'web_data' in matches
+
+
+def _scan_html(html_content: bytes) -> _Matches:
+    """
+    Returns {field key: (captured bytes, end offset)} for the first occurrence of
+    each field. Equivalent to searching each field's pattern separately, since
+    every field starts with (or just before) its literal anchor.
+
+    The place panel follows the name h1, so once the h1 is found only the
+    DETAILS_WINDOW bytes after it are scanned for the other fields. Each anchor
+    is located with bytes.find; no anchor can overlap another, so this visits the
+    same occurrences as a single alternation over the window.
+    """
+    matches: _Matches = {}
+    size = len(html_content)
+    start, end = 0, size
+    h1_match = _RE_H1.search(html_content)
+    if h1_match:
+        matches['h1'] = (h1_match.group(1), h1_match.end())
+        start, end = h1_match.end(), min(size, h1_match.end() + DETAILS_WINDOW)
+
+    for anchor, fields in _ANCHORS:
+        if _scan_settled(matches):
+            break
+        search_from = start
+        while not all(field[0] in matches for field in fields):
+            anchor_start = html_content.find(anchor, search_from, end)
+            if anchor_start < 0:
+                break
+            for key, parse, back, window in fields:
+                pos = anchor_start - back
+                if key in matches or pos < 0:
+                    continue
+                # endpos keeps lazy patterns from running across the rest of the document
+                endpos = size if window is None else anchor_start + window
+                found = parse(html_content, pos, endpos)
+                if found:
+                    matches[key] = found
+            search_from = anchor_start + len(anchor)
+    return matches
+
+
+def _extract_name(matches: _Matches) -> Optional[str]:
     """Extracts place name from the h1 tag."""
-    match = re.search(r'<h1[^>]*>(.*?)</h1>', html_content, re.DOTALL)
-    if match:
+    found = matches.get('h1')
+    if found:
         # Strip inner HTML tags
-        name = re.sub(r'<[^>]+>', '', match.group(1)).strip()
+        name = _decode(_strip_tags(found[0])).strip()
         if name:
             return name
     return None
 
 
-def _extract_rating(html_content):
+def _extract_rating(matches: _Matches) -> Optional[float]:
     """Extracts the average star rating from the rendered HTML."""
-    match = re.search(r'class="fontDisplayMedium">([\d.]+)</div>', html_content)
-    if match:
+    found = matches.get('rating')
+    if found:
         try:
-            return float(match.group(1))
+            return float(found[0])
         except ValueError:
             pass
     return None
 
 
-def _extract_reviews_count(html_content):
+def _extract_reviews_count(matches: _Matches) -> Optional[int]:
     """Extracts the total number of reviews."""
     # Pattern: rating followed by review count in nearby HTML
-    match = re.search(
-        r'fontDisplayMedium">[\d.]+<.*?>([\d,]+)\s+reviews?',
-        html_content, re.DOTALL
-    )
-    if match:
+    found = matches.get('reviews')
+    if found:
         try:
-            return int(match.group(1).replace(',', '').replace('.', ''))
+            return int(found[0].translate(None, _THOUSANDS_SEPARATORS))
         except ValueError:
             pass
     return None
 
 
-def _extract_address(html_content):
+def _extract_address(matches: _Matches) -> Optional[str]:
     """Extracts the address from aria-label or data-item-id."""
     # Try aria-label with Address:
-    match = re.search(r'aria-label="Address:\s*(.*?)\s*"', html_content)
-    if match:
-        return match.group(1).strip()
+    found = matches.get('addr_aria')
+    if found:
+        return _decode(found[0]).strip()
 
     # Try data-item-id="address" nearby aria-label
-    match = re.search(r'data-item-id="address"[^>]*aria-label="(.*?)"', html_content)
-    if match:
-        addr = match.group(1).strip()
+    found = matches.get('addr_data')
+    if found:
+        addr = _decode(found[0]).strip()
         if addr.startswith("Address:"):
             addr = addr[8:].strip()
         return addr
@@ -154,21 +391,21 @@ def _extract_address(html_content):
     return None
 
 
-def _extract_website(html_content):
+def _extract_website(matches: _Matches) -> Optional[str]:
     """Extracts the website URL."""
     # From aria-label with Website:
-    match = re.search(r'aria-label="Website:\s*(.*?)\s*"', html_content)
-    if match:
-        website = match.group(1).strip()
+    found = matches.get('web_aria')
+    if found:
+        website = _decode(found[0]).strip()
         if website:
             if not website.startswith(('http://', 'https://')):
                 website = 'https://' + website
             return website
 
     # From data-item-id="authority"
-    match = re.search(r'data-item-id="authority"[^>]*aria-label="[^"]*?([\w][\w.-]+\.\w{2,})', html_content)
-    if match:
-        website = match.group(1)
+    found = matches.get('web_data')
+    if found:
+        website = _decode(found[0])
         if not website.startswith(('http://', 'https://')):
             website = 'https://' + website
         return website
@@ -176,79 +413,313 @@ def _extract_website(html_content):
     return None
 
 
-def _extract_phone(html_content):
+def _extract_phone(matches: _Matches) -> Optional[str]:
     """Extracts the phone number."""
     # From data-item-id="phone:tel:XXXXX"
-    match = re.search(r'data-item-id="phone:tel:(\d+)"', html_content)
-    if match:
-        return match.group(1)
+    found = matches.get('phone_tel')
+    if found:
+        return found[0].decode('ascii')
 
     # From aria-label with Phone:
-    match = re.search(r'aria-label="Phone:\s*(.*?)\s*"', html_content)
-    if match:
-        phone = re.sub(r'\D', '', match.group(1))
+    found = matches.get('phone_aria')
+    if found:
+        phone = _RE_NON_DIGIT.sub('', _decode(found[0]))
         if phone:
             return phone
 
     return None
 
 
-def _extract_categories(html_content):
+def _is_category_text(text: str) -> bool:
+    """Tells whether a stripped span text after the h1 looks like the place category."""
+    # Skip ratings, review counts, and noise
+    if text in _CATEGORY_NOISE:
+        return False
+    digits = text.translate(_NUMERIC_PUNCTUATION)
+    if text and (not digits or digits.isdecimal()):
+        # Only digits and .,() (same as matching ^[\d.,()]+$)
+        return False
+    if 'review' in text.lower():
+        return False
+    if len(text) == 1 and not text.isalpha():
+        return False
+    # This is likely the category
+    return len(text) > 1 and (text[0].isalpha() or text[0].isdigit())
+
+
+def _extract_categories(html_content: bytes, matches: _Matches) -> Optional[List[str]]:
     """Extracts the place categories/type."""
-    categories = []
+    categories: List[str] = []
 
     # Look for category text near the h1 (name) element
-    h1_match = re.search(r'<h1[^>]*>.*?</h1>', html_content, re.DOTALL)
-    if h1_match:
-        h1_end = h1_match.end()
-        # Search in the area after h1 (within ~3000 chars)
-        area = html_content[h1_end:h1_end + 3000]
+    h1_found = matches.get('h1')
+    if h1_found:
+        h1_end = h1_found[1]
 
         # Pattern: category appears as a span text like "4-star hotel", "Hotel", "Restaurant"
         # Usually one of the first meaningful text spans after the rating area
-        spans = re.findall(r'<span[^>]*>([^<]{2,50})</span>', area)
-        for span_text in spans:
-            text = span_text.strip()
-            # Skip ratings, review counts, and noise
-            if re.match(r'^[\d.,()]+$', text):
-                continue
-            if 'review' in text.lower():
+        # Search in the area after h1 (bounded via pos/endpos, no slice copy)
+        for span in _RE_SPAN.finditer(html_content, h1_end, h1_end + CATEGORIES_WINDOW):
+            text = _decode(span.group(1))
+            if len(text) > 50:
                 continue
-            if text in ('·', '$$', '$$$', '$$$$', '$') or text == '\u00b7':
-                continue
-            if len(text) == 1 and not text.isalpha():
-                continue
-            # This is likely the category
-            if len(text) > 1 and (text[0].isalpha() or text[0].isdigit()):
+            text = text.strip()
+            if _is_category_text(text):
                 categories.append(text)
                 break  # Usually just one main category line
 
     return categories if categories else None
 
 
-def extract_place_data(html_content):
+# --- In-page extraction (Playwright) ---
+DOM_FOLLOWING_LIMIT = 60  # Elements after the h1/rating inspected for categories and reviews
+
+# Same fields and rules as the HTML scan, run on the live DOM in the browser so only the fields (not
+# the whole serialized DOM) cross the CDP bridge. Called with DOM_FOLLOWING_LIMIT; the category spans
+# are returned as candidates and filtered with _is_category_text by extract_rendered_place_data.
+RENDERED_FIELDS_JS = r"""
+(followingLimit) => {
+    const following = function* (node) {
+        for (; node; node = node.parentElement) {
+            for (let sibling = node.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+                yield sibling;
+                yield* sibling.querySelectorAll('*');
+            }
+        }
+    };
+    const ownText = (node) => {
+        const child = node.firstChild;
+        return child && child.nodeType === Node.TEXT_NODE && !child.nextSibling ? child.textContent : null;
+    };
+    const label = (node) => node.getAttribute('aria-label');
+    const fields = {};
+
+    const h1 = document.querySelector('h1');
+    if (h1) {
+        fields.name = h1.textContent.trim() || null;
+    }
+
+    const ratingNode = document.querySelector('div[class="fontDisplayMedium"]');
+    const ratingText = ratingNode ? ratingNode.textContent.trim() : '';
+    if (ratingText && !isNaN(Number(ratingText))) {
+        fields.rating = Number(ratingText);
+        // Review count is the first "N reviews" text after the rating
+        let index = 0;
+        for (const node of following(ratingNode)) {
+            if (index++ >= followingLimit) break;
+            const match = /^([\d,]+)\s+reviews?/.exec(ownText(node) || '');
+            if (match) {
+                const digits = match[1].replace(/,/g, '');
+                if (digits) fields.reviews_count = parseInt(digits, 10);
+                break;
+            }
+        }
+    }
+
+    let node = document.querySelector('[aria-label^="Address:"]');
+    if (node) {
+        fields.address = label(node).slice(8).trim();
+    } else if ((node = document.querySelector('[data-item-id="address"][aria-label]'))) {
+        let address = label(node).trim();
+        if (address.startsWith('Address:')) address = address.slice(8).trim();
+        fields.address = address;
+    }
+
+    let website = null;
+    if ((node = document.querySelector('[aria-label^="Website:"]'))) {
+        website = label(node).slice(8).trim();
+    }
+    if (!website && (node = document.querySelector('[data-item-id="authority"][aria-label]'))) {
+        const match = /([\p{L}\p{N}_][\p{L}\p{N}_.-]+\.[\p{L}\p{N}_]{2,})/u.exec(label(node) || '');
+        website = match ? match[1] : null;
+    }
+    if (website) {
+        fields.website = /^https?:\/\//.test(website) ? website : 'https://' + website;
+    }
+
+    for (const phoneNode of document.querySelectorAll('[data-item-id^="phone:tel:"]')) {
+        const number = phoneNode.getAttribute('data-item-id').slice('phone:tel:'.length);
+        if (/^\d+$/.test(number)) {
+            fields.phone = number;
+            break;
+        }
+    }
+    if (!('phone' in fields) && (node = document.querySelector('[aria-label^="Phone:"]'))) {
+        fields.phone = label(node).slice(6).replace(/\D/g, '') || null;
+    }
+
+    const categoryCandidates = [];
+    if (h1) {
+        let index = 0;
+        for (const node of following(h1)) {
+            if (index++ >= followingLimit) break;
+            if (node.tagName !== 'SPAN') continue;
+            const text = ownText(node);
+            const length = text ? [...text].length : 0;
+            if (length >= 2 && length <= 50) categoryCandidates.push(text.trim());
+        }
+    }
+    fields.categoryCandidates = categoryCandidates;
+    return fields;
+}
+"""
+
+
+def extract_rendered_place_data(
+    rendered: Optional[Dict[str, Any]], link: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Builds the place data from the fields RENDERED_FIELDS_JS collected in the page.
+
+    Returns None if the result would still need APP_INITIALIZATION_STATE (the link lacks the
+    place id or coordinates, or name, rating or address weren't rendered); callers then fall
+    back to extract_place_data on the page HTML.
+    """
+    if not rendered:
+        return None
+    fields = {key: rendered.get(key) for key in ('name', 'rating', 'reviews_count', 'address', 'website', 'phone')}
+    for text in rendered.get('categoryCandidates') or ():
+        if _is_category_text(text):
+            fields['categories'] = [text]
+            break
+
+    link_data = _extract_from_link(link) if link else {}
+    if _needs_app_init_state(fields, link_data):
+        return None
+    return _merge_place_details(fields, link_data, {})
+
+
+def _content_key(html_bytes: bytes) -> int:
+    """Returns the cache key for the page bytes."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(html_bytes)
+    return hash(html_bytes)
+
+
+def _looks_like_place_page(html_content: bytes) -> bool:
+    """
+    Cheap probe run before any extraction: error, captcha and consent pages have
+    neither the APP_INITIALIZATION_STATE script nor the rendered rating element.
+    """
+    return _APP_INIT_PROBE in html_content or _RATING_PROBE in html_content
+
+
+def _extract_from_link(link: str) -> Dict[str, Any]:
+    """Extracts place_id and coordinates from a /maps/place/ URL's data= tokens."""
+    result: Dict[str, Any] = {}
+    match = _RE_LINK_PLACE_ID.search(link)
+    if match:
+        result['place_id'] = match.group(1)
+    match = _RE_LINK_COORDS.search(link)
+    if match:
+        result['coordinates'] = {"latitude": float(match.group(1)), "longitude": float(match.group(2))}
+    return result
+
+
+def extract_place_data(html_content: Union[str, bytes], link: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Extracts place data from Google Maps HTML content.
     Uses HTML DOM parsing (aria-labels, data-item-ids, rendered elements)
     with fallback to APP_INITIALIZATION_STATE JSON for coordinates/place_id.
+
+    html_content may be the raw UTF-8 bytes of the page (preferred, no decode pass)
+    or a str, which is encoded once up front.
+
+    link (optional) is the place URL the page was loaded from. When it carries the
+    place id and coordinates and the rendered HTML has name, rating and address,
+    the APP_INITIALIZATION_STATE JSON is not parsed at all.
+
+    Results are memoized on a 64-bit hash of the page bytes, so re-processing
+    identical HTML (retries, revisits) skips extraction. A hash collision would
+    return another page's data; callers get a copy they are free to modify.
+
+    Pages with neither APP_INITIALIZATION_STATE nor a rendered rating (error or
+    captcha pages) return None without any parsing.
     """
     if not html_content:
         return None
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+    if not _looks_like_place_page(html_content):
+        return None
 
-    # Extract from rendered HTML (primary source - works with current Google Maps)
-    name = _extract_name(html_content)
-    rating = _extract_rating(html_content)
-    reviews_count = _extract_reviews_count(html_content)
-    address = _extract_address(html_content)
-    website = _extract_website(html_content)
-    phone = _extract_phone(html_content)
-    categories = _extract_categories(html_content)
+    key = (_content_key(html_content), link)
+    if key in _result_cache:
+        _result_cache.move_to_end(key)
+        return copy.deepcopy(_result_cache[key])
 
-    # Extract coordinates and place_id from APP_INITIALIZATION_STATE (still embedded there)
-    init_data = _extract_from_app_init_state(html_content)
+    place_details = _build_place_details(html_content, link)
 
-    place_id = init_data.get('place_id')
-    coordinates = init_data.get('coordinates')
+    _result_cache[key] = place_details
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return copy.deepcopy(place_details)
+
+
+def extract_many(
+    html_list: List[Union[str, bytes]],
+    links: Optional[List[Optional[str]]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 32,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Runs extract_place_data over many pages in a process pool (the extraction is
+    CPU-bound, so threads would serialize on the GIL). Returns the results in input order.
+
+    links (optional) is a list of place URLs parallel to html_list. workers defaults
+    to the CPU count. Each worker process has its own result cache.
+    """
+    if links is None:
+        links = [None] * len(html_list)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_place_data, html_list, links, chunksize=chunksize))
+
+
+def _build_place_details(html_content: bytes, link: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Runs the actual extraction on the page bytes (see extract_place_data)."""
+    # Extract from rendered HTML (primary source - works with current Google Maps)
+    matches = _scan_html(html_content)
+    fields = {
+        'name': _extract_name(matches),
+        'rating': _extract_rating(matches),
+        'reviews_count': _extract_reviews_count(matches),
+        'address': _extract_address(matches),
+        'website': _extract_website(matches),
+        'phone': _extract_phone(matches),
+        'categories': _extract_categories(html_content, matches),
+    }
+    link_data = _extract_from_link(link) if link else {}
+
+    # Extract coordinates and place_id from APP_INITIALIZATION_STATE (still embedded there),
+    # unless the link and the rendered HTML already provide everything it would be used for
+    if _needs_app_init_state(fields, link_data):
+        init_data = _extract_from_app_init_state(html_content)
+    else:
+        init_data = {}
+
+    return _merge_place_details(fields, link_data, init_data)
+
+
+def _needs_app_init_state(fields: Dict[str, Any], link_data: Dict[str, Any]) -> bool:
+    """Tells whether APP_INITIALIZATION_STATE could still add place_id, coordinates or a core field."""
+    return not all((link_data.get('place_id'), link_data.get('coordinates'),
+                    fields.get('name'), fields.get('rating'), fields.get('address')))
+
+
+def _merge_place_details(
+    fields: Dict[str, Any], link_data: Dict[str, Any], init_data: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Merges the rendered fields with the link and APP_INITIALIZATION_STATE data."""
+    name = fields.get('name')
+    rating = fields.get('rating')
+    reviews_count = fields.get('reviews_count')
+    address = fields.get('address')
+    website = fields.get('website')
+    phone = fields.get('phone')
+    categories = fields.get('categories')
+
+    place_id = init_data.get('place_id') or link_data.get('place_id')
+    coordinates = init_data.get('coordinates') or link_data.get('coordinates')
 
     # Use legacy data as fallback for any missing fields
     if not name:
@@ -265,7 +736,7 @@ def extract_place_data(html_content):
         categories = init_data.get('categories')
 
     # Build result, filtering None values
-    place_details = {}
+    place_details: Dict[str, Any] = {}
     if name:
         place_details['name'] = name
     if place_id:
@@ -290,7 +761,7 @@ def extract_place_data(html_content):
 
 if __name__ == '__main__':
     try:
-        with open('debug_place_page.html', 'r', encoding='utf-8') as f:
+        with open('debug_place_page.html', 'rb') as f:
             sample_html = f.read()
 
         extracted_info = extract_place_data(sample_html)
@@ -2,10 +2,11 @@ from fastapi import FastAPI, HTTPException, Query
 from typing import Optional, List, Dict, Any
 import logging
 import asyncio
+from contextlib import asynccontextmanager
 
 # Import the scraper function (adjust path if necessary)
 try:
-    from gmaps_scraper_server.scraper import scrape_google_maps
+    from gmaps_scraper_server.scraper import scrape_google_maps, shutdown_browser
 except ImportError:
     # Handle case where scraper might be in a different structure later
     logging.error("Could not import scrape_google_maps from scraper.py")
@@ -13,13 +14,23 @@ except ImportError:
     def scrape_google_maps(*args, **kwargs):
         raise ImportError("Scraper function not available.")
 
+    async def shutdown_browser():
+        pass
+
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Closes the browser shared by all scrape requests when the application shuts down."""
+    yield
+    await shutdown_browser()
+
 app = FastAPI(
     title="Google Maps Scraper API",
     description="API to trigger Google Maps scraping based on a query.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 @app.post("/scrape", response_model=List[Dict[str, Any]])
@@ -27,12 +38,14 @@ async def run_scrape(
     query: str = Query(..., description="The search query for Google Maps (e.g., 'restaurants in New York')"),
     max_places: Optional[int] = Query(None, description="Maximum number of places to scrape. Scrapes all found if None."),
     lang: str = Query("en", description="Language code for Google Maps results (e.g., 'en', 'es')."),
-    headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally.")
+    headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally."),
+    use_cache: bool = Query(True, description="Reuse place details scraped within the last 7 days instead of loading them again."),
+    stealth_mode: bool = Query(False, description="Use slow human-like delays and breaks between places. Lowers the risk of blocking but makes large scrapes much slower.")
 ):
     """
     Triggers the Google Maps scraping process for the given query.
     """
-    logging.info(f"Received scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, headless: {headless}")
+    logging.info(f"Received scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, headless: {headless}, use_cache: {use_cache}, stealth_mode: {stealth_mode}")
     try:
         # Run the potentially long-running scraping task with timeout
         # Note: For production, consider running this in a background task queue (e.g., Celery)
@@ -42,7 +55,9 @@ async def run_scrape(
                 query=query,
                 max_places=max_places,
                 lang=lang,
-                headless=headless
+                headless=headless,
+                use_cache=use_cache,
+                stealth_mode=stealth_mode
             ),
             timeout=3600  # 60 minutes timeout (1 hour)
         )
@@ -64,12 +79,14 @@ async def run_scrape_get(
     query: str = Query(..., description="The search query for Google Maps (e.g., 'restaurants in New York')"),
     max_places: Optional[int] = Query(None, description="Maximum number of places to scrape. Scrapes all found if None."),
     lang: str = Query("en", description="Language code for Google Maps results (e.g., 'en', 'es')."),
-    headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally.")
+    headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally."),
+    use_cache: bool = Query(True, description="Reuse place details scraped within the last 7 days instead of loading them again."),
+    stealth_mode: bool = Query(False, description="Use slow human-like delays and breaks between places. Lowers the risk of blocking but makes large scrapes much slower.")
 ):
     """
     Triggers the Google Maps scraping process for the given query via GET request.
     """
-    logging.info(f"Received GET scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, headless: {headless}")
+    logging.info(f"Received GET scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, headless: {headless}, use_cache: {use_cache}, stealth_mode: {stealth_mode}")
     try:
         # Run the potentially long-running scraping task with timeout
         # Note: For production, consider running this in a background task queue (e.g., Celery)
@@ -79,7 +96,9 @@ async def run_scrape_get(
                 query=query,
                 max_places=max_places,
                 lang=lang,
-                headless=headless
+                headless=headless,
+                use_cache=use_cache,
+                stealth_mode=stealth_mode
             ),
             timeout=3600  # 60 minutes timeout (1 hour)
         )
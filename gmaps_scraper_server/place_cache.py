@@ -0,0 +1,65 @@
+import json
+import os
+import sqlite3
+import time
+
+# --- Constants ---
+CACHE_PATH = os.environ.get('PLACE_CACHE_PATH', 'place_cache.sqlite3')
+CACHE_TTL = 7 * 24 * 3600  # Seconds a scraped place stays fresh (7 days)
+
+_connection = None
+
+
+def _get_connection():
+    """Opens the cache database on first use and creates the table if needed."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(CACHE_PATH)
+        _connection.execute(
+            'CREATE TABLE IF NOT EXISTS places ('
+            'key TEXT PRIMARY KEY, data TEXT NOT NULL, stored_at REAL NOT NULL)'
+        )
+        _connection.commit()
+    return _connection
+
+
+def _entry_key(key, lang):
+    """Returns the stored key of a place in a language (addresses and categories are localized)."""
+    return f"{lang}:{key}"
+
+
+def get_place(key, lang):
+    """
+    Looks up a previously scraped place.
+
+    Args:
+        key (str): The place's key, scraper.place_key() of its URL (the feature id,
+            so URLs with a different name slug or query string hit the same entry)
+        lang (str): Language code the place was scraped in
+
+    Returns:
+        dict or None: The cached place data, or None if missing or older than CACHE_TTL
+    """
+    row = _get_connection().execute(
+        'SELECT data, stored_at FROM places WHERE key = ?', (_entry_key(key, lang),)
+    ).fetchone()
+    if row is None or time.time() - row[1] > CACHE_TTL:
+        return None
+    return json.loads(row[0])
+
+
+def store_place(key, lang, place_data):
+    """
+    Stores the scraped data of a place, replacing any older entry.
+
+    Args:
+        key (str): The place's key (see get_place)
+        lang (str): Language code the place was scraped in
+        place_data (dict): The extracted place data
+    """
+    connection = _get_connection()
+    connection.execute(
+        'INSERT OR REPLACE INTO places (key, data, stored_at) VALUES (?, ?, ?)',
+        (_entry_key(key, lang), json.dumps(place_data, ensure_ascii=False), time.time()),
+    )
+    connection.commit()
@@ -2,20 +2,51 @@ import json
 import asyncio # Changed from time
 import re
 import random
+import itertools
+import functools
+import httpx
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError # Changed to async
 # Note: playwright-stealth 2.0 has API changes, so we rely on manual anti-detection
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
 
 # Import the extraction functions from our helper module
 from . import extractor
+from . import place_cache
 
 # --- Constants ---
 BASE_URL = "https://www.google.com/maps/search/"
 DEFAULT_TIMEOUT = 30000  # 30 seconds for navigation and selectors
+NAVIGATION_TIMEOUT = 8000  # Default page navigation timeout; readiness is gated on selectors instead
 SCROLL_PAUSE_TIME = 2.0  # Pause between scrolls (increased for more human-like behavior)
-MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 15 # Stop scrolling if no new links found after this many scrolls
+MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 3 # Stop scrolling after this many scrolls at the bottom of the feed without new links
 MIN_DELAY = 0.8  # Minimum delay between page loads
 MAX_DELAY = 1.5  # Maximum delay between page loads
+MAX_CONCURRENCY = 6  # Place detail pages loaded in parallel in the browser
+HTTP_CONCURRENCY = 16  # Place detail pages fetched in parallel over plain HTTP
+STEALTH_CONCURRENCY = 1  # stealth_mode loads one place at a time, so its delays pace the whole scrape
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+# Direct HTTP fetch of place pages (Playwright is only used when the raw HTML isn't enough)
+HTTP_TIMEOUT = 30.0  # Seconds
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+# Raw HTML without the rendered place panel (name header plus an address anchor) is re-loaded in
+# the browser: fields such as the phone only exist in the panel. A page that has the panel is
+# complete even without a phone, since many places simply have none.
+HTTP_PANEL_NAME_ANCHOR = b'<h1'
+HTTP_PANEL_ADDRESS_ANCHORS = (b'data-item-id="address"', b'aria-label="Address:')
+# After this many HTTP attempts without a single complete result, a scrape stops trying HTTP
+# first (Google's raw HTML usually lacks the rendered panel) and loads the rest in the browser
+HTTP_PROBE_PLACES = 3
+
+# Requests aborted by the browser; only the HTML is needed
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+# Place pages also skip stylesheets (the search feed keeps them, its scrolling depends on the layout)
+DETAIL_BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES | {'stylesheet'}
+BLOCKED_URL_KEYWORDS = ('google-analytics', 'googletagmanager', 'doubleclick')
+DETAIL_NAVIGATION_TIMEOUT = 10000  # Milliseconds to wait for a place page's name header
+CONSENT_TIMEOUT = 2.0  # Seconds allowed for finding and dismissing the consent form
+WEBSITE_CHECK_TIMEOUT = 10.0  # Seconds allowed for a business website to answer
 
 # Smart delay settings for human-like behavior
 READING_TIME_MIN = 2.0  # Minimum "reading" time (seconds)
@@ -25,8 +56,207 @@ BREAK_MIN = 20.0  # Minimum break duration (seconds)
 BREAK_MAX = 45.0  # Maximum break duration (seconds)
 OCCASIONAL_LONG_BREAK_CHANCE = 0.1  # 10% chance for a longer break
 
+# Selectors
+FEED_SELECTOR = '[role="feed"]'
+PLACE_LINK_SELECTOR = f'{FEED_SELECTOR} a[href*="/maps/place/"]'
+PLACE_NAME_SELECTOR = 'h1'
+END_MARKER_XPATH = "//span[contains(text(), \"You've reached the end of the list.\")]"
+CONSENT_BUTTON_XPATH = "//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Reject all')]]"
+ACCEPT_BUTTON_XPATH = "//button[.//span[contains(text(), 'Accept all')]]"
+# Feature id token of a place URL's data= path (!1s0x...:0x...), the same for every URL variant of a place
+PLACE_FEATURE_ID_RE = re.compile(r'!1s([^!?#/]+)')
+# Error messages that mean a website refused access
+FORBIDDEN_ERROR_RE = re.compile(r'forbidden|permission|access denied|unauthorized', re.IGNORECASE)
+
+# One scroll step in a single CDP round-trip: collects the place links rendered since the last step
+# (deduplicated in the page, so only new links cross the bridge), scrolls the feed further for
+# the next step, and reports whether that scroll reached the bottom (where the feed loads more)
+SCROLL_STEP_JS = """
+    ({feedSelector, linkSelector, endMarkerXPath, increment}) => {
+        const feed = document.querySelector(feedSelector);
+        const seen = window.__seen || (window.__seen = new Set());
+        const newLinks = [];
+        for (const a of document.querySelectorAll(linkSelector)) {
+            if (!seen.has(a.href)) {
+                seen.add(a.href);
+                newLinks.push(a.href);
+            }
+        }
+        const linkCount = document.querySelectorAll(linkSelector).length;
+        const endMarker = document.evaluate(
+            endMarkerXPath, document, null, XPathResult.BOOLEAN_TYPE, null
+        ).booleanValue;
+        feed.scrollTop += increment;
+        const atBottom = feed.scrollTop + feed.clientHeight >= feed.scrollHeight - 50;
+        return {linkCount, newLinks, atBottom, endMarker};
+    }
+"""
+
+# Resolves true as soon as more than previousCount links are rendered, false after timeoutMs
+WAIT_FOR_NEW_ITEMS_JS = """
+    ({feedSelector, linkSelector, previousCount, timeoutMs}) => new Promise((resolve) => {
+        const hasNewItems = () => document.querySelectorAll(linkSelector).length > previousCount;
+        if (hasNewItems()) {
+            resolve(true);
+            return;
+        }
+        const observer = new MutationObserver(() => {
+            if (hasNewItems()) {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(true);
+            }
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, timeoutMs);
+        observer.observe(document.querySelector(feedSelector) || document.body, {childList: true, subtree: true});
+    })
+"""
+
+# Anti-detection script injected into every page of the shared contexts (navigator overrides,
+# canvas and WebGL fingerprint noise); registered once per context
+INIT_SCRIPT = """
+    // Override the navigator.webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false,
+    });
+
+    // Override the plugins array
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    // Override the languages property
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+
+    // Pass the Chrome Test
+    window.chrome = {
+        runtime: {},
+    };
+
+    // Pass the Permissions Test
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Canvas Fingerprinting Protection
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    const originalToBlob = HTMLCanvasElement.prototype.toBlob;
+    const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
+
+    // Add noise to canvas to make fingerprint unique each time
+    // Random bytes come from crypto.getRandomValues in bulk (at most 65536 bytes per call)
+    // instead of three Math.random() calls per pixel
+    const NOISE_CHUNK = 65536;
+    const addNoise = (canvas, context) => {
+        const imageData = context.getImageData(0, 0, canvas.width, canvas.height);
+        const data = imageData.data;
+        const noise = new Uint8Array(data.length);
+        for (let offset = 0; offset < noise.length; offset += NOISE_CHUNK) {
+            crypto.getRandomValues(noise.subarray(offset, offset + NOISE_CHUNK));
+        }
+        for (let i = 0; i < data.length; i += 4) {
+            data[i] += noise[i] % 3 - 1;     // R
+            data[i+1] += noise[i+1] % 3 - 1; // G
+            data[i+2] += noise[i+2] % 3 - 1; // B
+        }
+        context.putImageData(imageData, 0, 0);
+    };
+
+    HTMLCanvasElement.prototype.toDataURL = function() {
+        addNoise(this, this.getContext('2d'));
+        return originalToDataURL.apply(this, arguments);
+    };
+
+    // WebGL Fingerprinting Protection
+    const getParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        // Randomize GPU vendor and renderer
+        if (parameter === 37445) { // UNMASKED_VENDOR_WEBGL
+            const vendors = ['Intel Inc.', 'Google Inc.', 'Mozilla', 'Apple Inc.'];
+            return vendors[Math.floor(Math.random() * vendors.length)];
+        }
+        if (parameter === 37446) { // UNMASKED_RENDERER_WEBGL
+            const renderers = [
+                'Intel Iris OpenGL Engine',
+                'ANGLE (Intel, Intel(R) UHD Graphics Direct3D11)',
+                'Mesa DRI Intel(R) HD Graphics',
+                'Apple M1'
+            ];
+            return renderers[Math.floor(Math.random() * renderers.length)];
+        }
+        return getParameter.apply(this, arguments);
+    };
+"""
+
 # --- Helper Functions ---
 
+def build_request_headers(lang="en"):
+    """Returns the browser-like request headers sent with every page request."""
+    return {
+        'Accept-Language': f'{lang},en-US;q=0.9,en;q=0.8',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+    }
+
+def create_http_client(lang="en"):
+    """
+    Creates the pooled HTTP/2 client used to fetch place pages without a browser.
+
+    Args:
+        lang (str): Language code sent in Accept-Language
+
+    Returns:
+        httpx.AsyncClient: Client with keep-alive connection pooling (close with aclose())
+    """
+    headers = build_request_headers(lang)
+    headers.pop('Accept-Encoding')  # Let httpx advertise only the encodings it can decode
+    headers['User-Agent'] = USER_AGENT
+    return httpx.AsyncClient(
+        http2=True,
+        headers=headers,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+async def fetch_html(http_client, link):
+    """
+    Fetches the raw (unrendered) HTML of a page over HTTP.
+
+    Args:
+        http_client: httpx.AsyncClient from create_http_client()
+        link (str): The URL to fetch
+
+    Returns:
+        bytes or None: The page bytes, or None on a network error or non-200 response
+    """
+    try:
+        response = await http_client.get(link)
+    except httpx.HTTPError as e:
+        print(f"  - HTTP fetch failed ({type(e).__name__}), using browser: {link}")
+        return None
+    if response.status_code != 200:
+        print(f"  - HTTP fetch returned {response.status_code}, using browser: {link}")
+        return None
+    return response.content
+
 def calculate_fatigue_delay(place_count):
     """
     Simulates human fatigue - slower responses after prolonged use.
@@ -91,16 +321,23 @@ async def natural_scroll(page, feed_selector):
         print(f"Natural scroll error: {e}")
         return 0
 
-async def smart_delay(place_count):
+async def smart_delay(place_count, stealth_mode=False, break_over=None):
     """
     Implements human-like delays with variation.
 
     Args:
         place_count (int): Current place number being processed
+        stealth_mode (bool): Add reading time, fatigue slowdown and periodic breaks.
+            When False only a short jitter is returned.
+        break_over (asyncio.Event, optional): Shared by the workers of a scrape and cleared
+            for the length of a break, so every worker waiting on it pauses too
 
     Returns:
         float: Delay duration in seconds
     """
+    if not stealth_mode:
+        return random.uniform(0.2, 0.5)
+
     # Base delay: Random between 1-3 seconds
     base_delay = random.uniform(MIN_DELAY, MAX_DELAY) + random.uniform(0.5, 1.5)
 
@@ -127,15 +364,95 @@ async def smart_delay(place_count):
         # Regular break every BREAK_INTERVAL places
         break_time = random.uniform(BREAK_MIN, BREAK_MAX)
         print(f"\n[BREAK] Taking a human-like break for {break_time:.1f} seconds...")
-        await asyncio.sleep(break_time)
+        if break_over is not None:
+            break_over.clear()
+        try:
+            await asyncio.sleep(break_time)
 
-        # Small chance for an even longer break (simulate coffee/bathroom break)
-        if random.random() < OCCASIONAL_LONG_BREAK_CHANCE:
-            extra_break = random.uniform(30.0, 60.0)
-            print(f"[EXTENDED BREAK] Extended break for {extra_break:.1f} more seconds...")
-            await asyncio.sleep(extra_break)
+            # Small chance for an even longer break (simulate coffee/bathroom break)
+            if random.random() < OCCASIONAL_LONG_BREAK_CHANCE:
+                extra_break = random.uniform(30.0, 60.0)
+                print(f"[EXTENDED BREAK] Extended break for {extra_break:.1f} more seconds...")
+                await asyncio.sleep(extra_break)
+        finally:
+            if break_over is not None:
+                break_over.set()
 
     return total_delay
+async def block_unneeded_requests(route, blocked_types=BLOCKED_RESOURCE_TYPES):
+    """
+    Route handler that aborts images, media, fonts (plus any other blocked_types) and
+    analytics requests, and lets everything else through.
+
+    Args:
+        route: Playwright route of the intercepted request
+        blocked_types (frozenset): Resource types to abort
+    """
+    request = route.request
+    if request.resource_type in blocked_types or any(keyword in request.url for keyword in BLOCKED_URL_KEYWORDS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def wait_for_new_items(page, prev_count, timeout_ms=3000):
+    """
+    Waits until the feed renders more than prev_count place links, using a MutationObserver
+    in the page instead of a fixed sleep.
+
+    Args:
+        page: Playwright page object
+        prev_count (int): Number of place links rendered before the scroll
+        timeout_ms (int): Maximum wait in milliseconds
+
+    Returns:
+        bool: True if new links appeared, False on timeout
+    """
+    return await page.evaluate(WAIT_FOR_NEW_ITEMS_JS, {
+        'feedSelector': FEED_SELECTOR,
+        'linkSelector': PLACE_LINK_SELECTOR,
+        'previousCount': prev_count,
+        'timeoutMs': timeout_ms,
+    })
+
+async def handle_consent(page):
+    """
+    Waits up to CONSENT_TIMEOUT for the cookie consent form and dismisses it.
+    Raises PlaywrightTimeoutError if no form shows up; callers also bound the whole
+    call (clicks included) with asyncio.wait_for.
+
+    Args:
+        page: Playwright page object
+    """
+    # This is a common pattern, might need adjustment based on specific consent popups
+    await page.wait_for_selector(CONSENT_BUTTON_XPATH, state='visible', timeout=CONSENT_TIMEOUT * 1000)
+    # Click the "Accept all" or equivalent button if found
+    # Example: Prioritize "Accept all"
+    accept_button = await page.query_selector(ACCEPT_BUTTON_XPATH)
+    if accept_button:
+        print("Accepting consent form...")
+        await accept_button.click()
+    else:
+        # Fallback to clicking the first consent button found (might be reject)
+        print("Clicking first available consent button...")
+        await page.locator(CONSENT_BUTTON_XPATH).first.click()
+    # Short pause for the popup to close (networkidle never settles on Google Maps' long-polling)
+    await asyncio.sleep(0.2)
+
+def canonical_place_url(url):
+    """
+    Normalizes a place URL: drops the fragment and every query parameter except hl
+    (which keeps the page language). The /maps/place/<name>/data=... path is kept whole,
+    since its !3d/!4d coordinates are used by the extractor.
+    """
+    parts = urlsplit(url)
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query) if key == 'hl'])
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+
+def place_key(url):
+    """Returns the place's feature id token if the URL has one, else its canonical URL."""
+    match = PLACE_FEATURE_ID_RE.search(url)
+    return match.group(1) if match else canonical_place_url(url)
+
 def create_search_url(query, lang="en", geo_coordinates=None, zoom=None):
     """Creates a Google Maps search URL."""
     params = {'q': query, 'hl': lang}
@@ -143,48 +460,335 @@ def create_search_url(query, lang="en", geo_coordinates=None, zoom=None):
     # For simplicity, starting with basic query search
     return BASE_URL + "?" + urlencode(params)
 
-async def try_load_website(page, website_url, timeout=10000):
+async def check_website(http_client, website_url, timeout=WEBSITE_CHECK_TIMEOUT):
     """
-    Attempts to load a business website and returns status.
+    Checks whether a business website is reachable with an HTTP HEAD request,
+    without a browser. Any HEAD error status is retried with GET, since many
+    servers reject or mishandle HEAD (405/501, but also 403, 404 or 500), and
+    only the GET status is classified.
 
     Args:
-        page: Playwright page object
-        website_url: The website URL to load
-        timeout: Timeout in milliseconds (default 10 seconds)
+        http_client: httpx.AsyncClient (follows redirects)
+        website_url: The website URL to check
+        timeout: Timeout in seconds (default 10 seconds)
 
     Returns:
         str: Status - 'accessible', 'forbidden', 'timeout', or 'error'
     """
     try:
-        response = await page.goto(website_url, wait_until='domcontentloaded', timeout=timeout)
+        response = await http_client.head(website_url, timeout=timeout)
+        if response.status_code >= 400:
+            response = await http_client.get(website_url, timeout=timeout)
+        status_code = response.status_code
 
-        if response:
-            status_code = response.status
-
-            # Check for forbidden/access denied errors
-            if status_code in [403, 401, 451]:  # Forbidden, Unauthorized, Unavailable For Legal Reasons
-                return "forbidden"
-            elif status_code >= 400:  # Other client/server errors
-                return "error"
-            else:
-                return "accessible"
-        else:
-            # No response received
+        # Check for forbidden/access denied errors
+        if status_code in [403, 401, 451]:  # Forbidden, Unauthorized, Unavailable For Legal Reasons
+            return "forbidden"
+        elif status_code >= 400:  # Other client/server errors
             return "error"
+        else:
+            return "accessible"
 
-    except PlaywrightTimeoutError:
+    except httpx.TimeoutException:
         # Timeout while loading website
         return "timeout"
     except Exception as e:
         # Check if error message contains forbidden/permission keywords
-        error_str = str(e).lower()
-        if any(keyword in error_str for keyword in ['forbidden', 'permission', 'access denied', 'unauthorized']):
+        if FORBIDDEN_ERROR_RE.search(str(e)):
             return "forbidden"
         else:
             return "error"
 
+async def check_place_website(http_client, place_data):
+    """
+    Checks the place's website (if any) and replaces it with a status label when it
+    isn't accessible, keeping the URL in 'original_website'.
+
+    Args:
+        http_client: httpx.AsyncClient shared by the detail workers
+        place_data (dict): Extracted place data, updated in place
+    """
+    website_url = place_data.get('website', '')
+    if not website_url or website_url in ['', 'N/A', None]:
+        return
+
+    print(f"  >> Attempting to access website: {website_url}")
+    try:
+        website_status = await check_website(http_client, website_url)
+
+        if website_status == "accessible":
+            print(f"  [OK] Website accessible: {website_url}")
+        elif website_status == "forbidden":
+            print(f"  [FORBIDDEN] Website requires access - marking as 'Potreban pristup'")
+            place_data['website'] = 'Potreban pristup'
+            place_data['original_website'] = website_url
+        elif website_status == "timeout":
+            print(f"  [TIMEOUT] Website timeout")
+            place_data['website'] = 'Timeout'
+            place_data['original_website'] = website_url
+        elif website_status == "error":
+            print(f"  [ERROR] Website error")
+            place_data['website'] = 'Greška pri učitavanju'
+            place_data['original_website'] = website_url
+    except Exception as e:
+        # Catch ALL exceptions including ForbiddenException
+        # This ensures the workflow never stops due to website checking
+        print(f"  [WARNING] Website check exception (continuing): {type(e).__name__}: {str(e)}")
+        place_data['website'] = 'Greška pri provjeri'
+        place_data['original_website'] = website_url
+        # Continue scraping - don't let website errors stop the workflow
+
+async def acquire_detail_page(context, detail_pages):
+    """
+    Takes an idle detail tab from the pool, opening a new one if none is free.
+    Tabs are reused across places, so the tab setup and route registration happen once per worker.
+
+    Args:
+        context: Playwright browser context shared by the detail workers
+        detail_pages (asyncio.Queue): Idle detail tabs of the current scrape
+
+    Returns:
+        Page: A tab with the detail request blocking installed
+    """
+    if not detail_pages.empty():
+        return detail_pages.get_nowait()
+    page = await context.new_page()
+    await page.route("**/*", functools.partial(block_unneeded_requests, blocked_types=DETAIL_BLOCKED_RESOURCE_TYPES))
+    return page
+
+async def pace_place(link, place_number, total_places, stealth_mode=False, break_over=None):
+    """
+    Waits before a place is loaded (see smart_delay), whichever stage ends up loading it.
+
+    Args:
+        link (str): The place URL (for logging)
+        place_number (int): 1-based number of this place (drives smart_delay)
+        total_places (int): Number of places being scraped (for logging)
+        stealth_mode (bool): Use the human-like delays of smart_delay
+        break_over (asyncio.Event, optional): Shared break flag, see smart_delay
+    """
+    print(f"Processing link {place_number}/{total_places}: {link}")
+
+    # Use smart delay algorithm for human-like behavior
+    delay = await smart_delay(place_number, stealth_mode, break_over)
+    print(f"  >> Waiting {delay:.1f}s before loading...")
+    await asyncio.sleep(delay)
+    if break_over is not None:
+        await break_over.wait()  # Another worker started a break meanwhile
+
+async def fetch_place_http(http_client, link):
+    """
+    First stage of the detail pipeline: fetches a place page over plain HTTP and extracts it,
+    without touching the browser.
+
+    Args:
+        http_client: httpx.AsyncClient shared by the detail workers
+        link (str): The place URL
+
+    Returns:
+        dict or None: The place data, or None if the fetch failed or the raw HTML lacks the
+            rendered place panel (the caller then loads the page with scrape_place)
+    """
+    html_content = await fetch_html(http_client, link)
+    if not html_content:
+        return None
+    if (HTTP_PANEL_NAME_ANCHOR not in html_content
+            or not any(anchor in html_content for anchor in HTTP_PANEL_ADDRESS_ANCHORS)):
+        # Consent page or details only rendered by JavaScript
+        print(f"  - Raw HTML incomplete, using browser: {link}")
+        return None
+    try:
+        place_data = extractor.extract_place_data(html_content, link)
+    except Exception as e:
+        print(f"  - Error extracting raw HTML of {link}, using browser: {e}")
+        return None
+
+    if not place_data:
+        print(f"  - Raw HTML incomplete, using browser: {link}")
+        return None
+    place_data['link'] = link # Add the source link
+    return place_data
+
+async def scrape_place(context, detail_pages, link):
+    """
+    Second stage of the detail pipeline: loads a place that fetch_place_http could not
+    extract in a pooled browser tab. The website check is left to the caller
+    (see check_place_website).
+
+    Args:
+        context: Playwright browser context shared by the detail workers
+        detail_pages (asyncio.Queue): Idle detail tabs, see acquire_detail_page
+        link (str): The place URL
+
+    Returns:
+        dict or None: The place data, or None if loading or extraction failed
+    """
+    page = None
+    try:
+        page = await acquire_detail_page(context, detail_pages)
+        # Don't wait for the load events; the name header is the readiness signal
+        await page.goto(link, wait_until='commit', timeout=DETAIL_NAVIGATION_TIMEOUT)
+        try:
+            await page.wait_for_selector(PLACE_NAME_SELECTOR, timeout=DETAIL_NAVIGATION_TIMEOUT)
+        except PlaywrightTimeoutError:
+            print(f"  - Place name header not rendered, extracting anyway: {link}")
+
+        # Additional small random delay after page load
+        await asyncio.sleep(random.uniform(0.5, 1.0))
+
+        # Extract in the page so only the fields cross the CDP bridge, not the whole DOM
+        rendered = await page.evaluate(extractor.RENDERED_FIELDS_JS, extractor.DOM_FOLLOWING_LIMIT)
+        place_data = extractor.extract_rendered_place_data(rendered, link)
+        if not place_data:
+            # Incomplete without APP_INITIALIZATION_STATE: parse the full HTML
+            html_content = await page.content()
+            place_data = extractor.extract_place_data(html_content, link)
+
+        if place_data:
+            place_data['link'] = link # Add the source link
+            # print(json.dumps(place_data, indent=2)) # Optional: print data as it's scraped
+            return place_data
+        else:
+            print(f"  - Failed to extract data for: {link}")
+            # Optionally save the HTML for debugging
+            # with open("error_page.html", "w", encoding="utf-8") as f:
+            #     f.write(html_content)
+            return None
+
+    except PlaywrightTimeoutError:
+        print(f"  - Timeout navigating to or processing: {link}")
+        # Even on timeout, continue to next place - don't lose all data!
+        return None
+    except Exception as e:
+        print(f"  - Error processing {link}: {e}")
+        # A tab in an unknown state is not worth reusing
+        if page is not None:
+            await page.close()
+        # Even on error, continue to next place - don't lose all data!
+        return None
+    finally:
+        # Hand the tab back for the next place; its next goto replaces this one
+        if page is not None and not page.is_closed():
+            detail_pages.put_nowait(page)
+
+# --- Shared Browser ---
+# One browser per headless setting (and one context per language in it) is kept alive across
+# scrape_google_maps calls; launching Chromium and setting up a context is the most expensive
+# part of a short scrape. A browser is only closed if it crashed or on shutdown, never while
+# another call may still be using it.
+_playwright = None
+_browsers = {}  # headless -> Browser
+_contexts = {}  # (headless, lang) -> BrowserContext
+_consent_dismissed = set()  # (headless, lang) of the contexts that already dismissed the consent form
+_browser_lock = asyncio.Lock()
+# The HTTP client is kept alive too, so its pooled connections survive between calls
+_http_clients = {}  # lang -> httpx.AsyncClient
+
+async def _launch_browser(playwright, headless):
+    """Launches Chromium with the anti-detection flags."""
+    return await playwright.chromium.launch(
+        headless=headless,
+        args=[
+            '--disable-dev-shm-usage',  # Use /tmp instead of /dev/shm for shared memory
+            '--no-sandbox',  # Required for running in Docker
+            '--disable-setuid-sandbox',
+            '--disable-blink-features=AutomationControlled',  # Hide automation
+        ]
+    )
+
+async def _create_context(browser, lang):
+    """Creates a browser context for the language, with request blocking and anti-detection scripts."""
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={'width': 1920, 'height': 1080},
+        java_script_enabled=True,
+        accept_downloads=False,
+        locale=lang,
+        timezone_id='Europe/Sarajevo',
+        geolocation={'latitude': 43.8563, 'longitude': 18.4131},  # Sarajevo coordinates
+        permissions=['geolocation'],
+        extra_http_headers=build_request_headers(lang)
+    )
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+    await context.route("**/*", block_unneeded_requests)
+
+    # Note: Manual anti-detection methods applied via browser args,
+    # context settings, and JavaScript injections below
+
+    # Additional anti-detection: Override navigator properties
+    # (registered on the context so every detail page gets it too)
+    await context.add_init_script(INIT_SCRIPT)
+    return context
+
+async def get_context(headless=True, lang="en"):
+    """
+    Returns the shared browser context for the language, launching the browser on first use.
+
+    Args:
+        headless (bool): Whether the browser runs headless. Headless and headed scrapes
+            get separate browsers, so neither closes the other's contexts.
+        lang (str): Language code; each language gets its own context (locale, headers)
+
+    Returns:
+        BrowserContext: The shared context (callers open and close their own pages)
+    """
+    global _playwright
+    async with _browser_lock:
+        browser = _browsers.get(headless)
+        if browser is not None and not browser.is_connected():
+            # Crashed: its contexts are gone with it
+            await _close_browser(headless)
+            browser = None
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        if browser is None:
+            browser = _browsers[headless] = await _launch_browser(_playwright, headless)
+        if (headless, lang) not in _contexts:
+            _contexts[(headless, lang)] = await _create_context(browser, lang)
+        return _contexts[(headless, lang)]
+
+async def _close_browser(headless):
+    """Closes the shared browser for the headless setting and its contexts (the caller holds _browser_lock)."""
+    for key in [key for key in _contexts if key[0] == headless]:
+        try:
+            await _contexts.pop(key).close()
+        except Exception:
+            pass  # Already closed along with a crashed browser
+        _consent_dismissed.discard(key)
+    browser = _browsers.pop(headless, None)
+    if browser is not None and browser.is_connected():
+        await browser.close()
+
+def get_http_client(lang="en"):
+    """
+    Returns the shared HTTP client for the language, creating it on first use.
+
+    Args:
+        lang (str): Language code sent in Accept-Language
+
+    Returns:
+        httpx.AsyncClient: The shared client (closed by shutdown_browser)
+    """
+    http_client = _http_clients.get(lang)
+    if http_client is None or http_client.is_closed:
+        http_client = _http_clients[lang] = create_http_client(lang)
+    return http_client
+
+async def shutdown_browser():
+    """Closes the shared browser and HTTP clients and stops Playwright (call on application shutdown)."""
+    global _playwright
+    async with _browser_lock:
+        for headless in list(_browsers):
+            await _close_browser(headless)
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+    for http_client in _http_clients.values():
+        await http_client.aclose()
+    _http_clients.clear()
+
 # --- Main Scraping Logic ---
-async def scrape_google_maps(query, max_places=None, lang="en", headless=True): # Added async
+async def scrape_google_maps(query, max_places=None, lang="en", headless=True, use_cache=True, stealth_mode=False): # Added async
     """
     Scrapes Google Maps for places based on a query.
 
@@ -193,317 +797,212 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True):
         max_places (int, optional): Maximum number of places to scrape. Defaults to None (scrape all found).
         lang (str, optional): Language code for Google Maps (e.g., 'en', 'es'). Defaults to "en".
         headless (bool, optional): Whether to run the browser in headless mode. Defaults to True.
+        use_cache (bool, optional): Reuse place details scraped within the last place_cache.CACHE_TTL
+            instead of loading the page again. Defaults to True.
+        stealth_mode (bool, optional): Pace the detail requests like a human: places are loaded
+            one at a time (STEALTH_CONCURRENCY), with reading time, a slowdown of up to 2.2x
+            after many places and 20-60 s breaks every BREAK_INTERVAL places. This lowers the
+            chance of being rate limited or blocked, but makes large scrapes many minutes
+            slower. Defaults to False (short random delays only).
 
     Returns:
         list: A list of dictionaries, each containing details for a scraped place.
               Returns an empty list if no places are found or an error occurs.
     """
     results = []
-    place_links = set()
+    place_links = []  # Canonical place URLs, in feed order
+    place_keys = set()  # place_key() of each collected link, so URL variants of a place count once
     scroll_attempts_no_new = 0
-    browser = None
+    page = None
+    detail_pages = None
+
+    try:
+        context = await get_context(headless, lang)
 
-    async with async_playwright() as p: # Changed to async
+        page = await context.new_page() # Added await
+        if not page:
+            raise Exception("Failed to create a new browser page (context.new_page() returned None).")
+
+        # Removed problematic: await page.set_default_timeout(DEFAULT_TIMEOUT)
+        # Removed associated debug prints
+
+        search_url = create_search_url(query, lang)
+        print(f"Navigating to search URL: {search_url}")
         try:
-            browser = await p.chromium.launch(
-                headless=headless,
-                args=[
-                    '--disable-dev-shm-usage',  # Use /tmp instead of /dev/shm for shared memory
-                    '--no-sandbox',  # Required for running in Docker
-                    '--disable-setuid-sandbox',
-                    '--disable-blink-features=AutomationControlled',  # Hide automation
-                ]
-            ) # Added await
-            context = await browser.new_context( # Added await
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-                viewport={'width': 1920, 'height': 1080},
-                java_script_enabled=True,
-                accept_downloads=False,
-                locale=lang,
-                timezone_id='Europe/Sarajevo',
-                geolocation={'latitude': 43.8563, 'longitude': 18.4131},  # Sarajevo coordinates
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept-Language': f'{lang},en-US;q=0.9,en;q=0.8',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                }
-            )
-            page = await context.new_page() # Added await
-
-            # Note: Manual anti-detection methods applied via browser args,
-            # context settings, and JavaScript injections below
-            if not page:
-                await browser.close() # Close browser before raising
-                raise Exception("Failed to create a new browser page (context.new_page() returned None).")
-
-            # Additional anti-detection: Override navigator properties
-            await page.add_init_script("""
-                // Override the navigator.webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false,
-                });
-
-                // Override the plugins array
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-
-                // Override the languages property
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-
-                // Pass the Chrome Test
-                window.chrome = {
-                    runtime: {},
-                };
-
-                // Pass the Permissions Test
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-
-                // Canvas Fingerprinting Protection
-                const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-                const originalToBlob = HTMLCanvasElement.prototype.toBlob;
-                const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
-
-                // Add noise to canvas to make fingerprint unique each time
-                const addNoise = (canvas, context) => {
-                    const imageData = context.getImageData(0, 0, canvas.width, canvas.height);
-                    for (let i = 0; i < imageData.data.length; i += 4) {
-                        imageData.data[i] += Math.floor(Math.random() * 3) - 1;     // R
-                        imageData.data[i+1] += Math.floor(Math.random() * 3) - 1;   // G
-                        imageData.data[i+2] += Math.floor(Math.random() * 3) - 1;   // B
-                    }
-                    context.putImageData(imageData, 0, 0);
-                };
-
-                HTMLCanvasElement.prototype.toDataURL = function() {
-                    addNoise(this, this.getContext('2d'));
-                    return originalToDataURL.apply(this, arguments);
-                };
-
-                // WebGL Fingerprinting Protection
-                const getParameter = WebGLRenderingContext.prototype.getParameter;
-                WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                    // Randomize GPU vendor and renderer
-                    if (parameter === 37445) { // UNMASKED_VENDOR_WEBGL
-                        const vendors = ['Intel Inc.', 'Google Inc.', 'Mozilla', 'Apple Inc.'];
-                        return vendors[Math.floor(Math.random() * vendors.length)];
-                    }
-                    if (parameter === 37446) { // UNMASKED_RENDERER_WEBGL
-                        const renderers = [
-                            'Intel Iris OpenGL Engine',
-                            'ANGLE (Intel, Intel(R) UHD Graphics Direct3D11)',
-                            'Mesa DRI Intel(R) HD Graphics',
-                            'Apple M1'
-                        ];
-                        return renderers[Math.floor(Math.random() * renderers.length)];
-                    }
-                    return getParameter.apply(this, arguments);
-                };
-            """)
-
-            # Removed problematic: await page.set_default_timeout(DEFAULT_TIMEOUT)
-            # Removed associated debug prints
-
-            search_url = create_search_url(query, lang)
-            print(f"Navigating to search URL: {search_url}")
-            await page.goto(search_url, wait_until='domcontentloaded') # Added await
-            await asyncio.sleep(random.uniform(2.0, 3.5)) # More human-like initial delay
-
-            # --- Handle potential consent forms ---
-            # This is a common pattern, might need adjustment based on specific consent popups
+            # Only wait for the response to start; the feed selector below is the readiness check
+            await page.goto(search_url, wait_until='commit', timeout=NAVIGATION_TIMEOUT)
+        except PlaywrightTimeoutError:
+            print("Search navigation slow to commit, waiting for the results feed anyway.")
+        await asyncio.sleep(random.uniform(2.0, 3.5)) # More human-like initial delay
+
+        # --- Handle potential consent forms ---
+        # The consent cookie lives in the shared context, so this only runs until it was dismissed once
+        if (headless, lang) not in _consent_dismissed:
             try:
-                consent_button_xpath = "//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Reject all')]]"
-                # Wait briefly for the button to potentially appear
-                await page.wait_for_selector(consent_button_xpath, state='visible', timeout=5000) # Added await
-                # Click the "Accept all" or equivalent button if found
-                # Example: Prioritize "Accept all"
-                accept_button = await page.query_selector("//button[.//span[contains(text(), 'Accept all')]]") # Added await
-                if accept_button:
-                    print("Accepting consent form...")
-                    await accept_button.click() # Added await
-                else:
-                    # Fallback to clicking the first consent button found (might be reject)
-                    print("Clicking first available consent button...")
-                    await page.locator(consent_button_xpath).first.click() # Added await
-                # Wait for navigation/popup closure
-                await page.wait_for_load_state('networkidle', timeout=5000) # Added await
-            except PlaywrightTimeoutError:
+                await asyncio.wait_for(handle_consent(page), timeout=CONSENT_TIMEOUT)
+                _consent_dismissed.add((headless, lang))
+            except (asyncio.TimeoutError, PlaywrightTimeoutError):
                 print("No consent form detected or timed out waiting.")
             except Exception as e:
                 print(f"Error handling consent form: {e}")
 
 
-            # --- Scrolling and Link Extraction ---
-            print("Scrolling to load places...")
-            feed_selector = '[role="feed"]'
-            try:
-                await page.wait_for_selector(feed_selector, state='visible', timeout=25000) # Added await
-            except PlaywrightTimeoutError:
-                 # Check if it's a single result page (maps/place/)
-                if "/maps/place/" in page.url:
-                    print("Detected single place page.")
-                    place_links.add(page.url)
-                else:
-                    print(f"Error: Feed element '{feed_selector}' not found. Maybe no results or page structure changed.")
-                    await browser.close() # Added await
-                    return [] # No results or page structure changed
-
-            if await page.locator(feed_selector).count() > 0: # Added await
-                last_height = await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollHeight') # Added await
-                scroll_iteration = 0
-                while True:
-                    scroll_iteration += 1
-                    # Natural scroll - simulate human scrolling behavior
-                    # Scroll in small increments instead of jumping to bottom
-                    current_scroll = await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollTop')
-                    scroll_increment = random.randint(300, 800)  # Random scroll amount
-                    new_scroll_position = current_scroll + scroll_increment
-
-                    await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollTop = {new_scroll_position}')
-
-                    # Variable pause between scrolls (more human-like)
-                    scroll_pause = random.uniform(0.8, 2.5)
-                    await asyncio.sleep(scroll_pause)
-
-                    # Occasionally pause longer (15% chance) as if reading something
-                    if random.random() < 0.15:
-                        read_pause = random.uniform(1.5, 3.5)
-                        await asyncio.sleep(read_pause)
-
-                    # Extract links after scroll
-                    current_links_list = await page.locator(f'{feed_selector} a[href*="/maps/place/"]').evaluate_all('elements => elements.map(a => a.href)') # Added await
-                    current_links = set(current_links_list)
-                    new_links_found = len(current_links - place_links) > 0
-                    place_links.update(current_links)
-                    print(f"Found {len(place_links)} unique place links so far...")
-
-                    if max_places is not None and len(place_links) >= max_places:
-                        print(f"Reached max_places limit ({max_places}).")
-                        place_links = set(list(place_links)[:max_places]) # Trim excess links
+        # --- Scrolling and Link Extraction ---
+        print("Scrolling to load places...")
+        try:
+            await page.wait_for_selector(FEED_SELECTOR, state='visible', timeout=25000) # Added await
+        except PlaywrightTimeoutError:
+             # Check if it's a single result page (maps/place/)
+            if "/maps/place/" in page.url:
+                print("Detected single place page.")
+                place_links.append(canonical_place_url(page.url))
+            else:
+                print(f"Error: Feed element '{FEED_SELECTOR}' not found. Maybe no results or page structure changed.")
+                return [] # No results or page structure changed (page closed in finally)
+
+        if await page.locator(FEED_SELECTOR).count() > 0: # Added await
+            await page.evaluate("window.__seen = new Set()")
+            scroll_iteration = 0
+            while True:
+                scroll_iteration += 1
+                # Collect the links loaded by the previous scroll, then scroll on
+                # Natural scroll - simulate human scrolling behavior
+                # Scroll in small increments instead of jumping to bottom
+                step = await page.evaluate(SCROLL_STEP_JS, {
+                    'feedSelector': FEED_SELECTOR,
+                    'linkSelector': PLACE_LINK_SELECTOR,
+                    'endMarkerXPath': END_MARKER_XPATH,
+                    'increment': random.randint(300, 800),  # Random scroll amount
+                })
+                links_before = len(place_links)
+                for href in step['newLinks']:
+                    key = place_key(href)
+                    if key not in place_keys:
+                        place_keys.add(key)
+                        place_links.append(canonical_place_url(href))
+                new_links_found = len(place_links) > links_before
+                print(f"Found {len(place_links)} unique place links so far...")
+
+                if max_places is not None and len(place_links) >= max_places:
+                    print(f"Reached max_places limit ({max_places}).")
+                    place_links = place_links[:max_places] # Trim excess links
+                    break
+
+                # Check for the "end of results" marker (evaluated in the same step)
+                if step['endMarker']:
+                    print("Reached the end of the results list.")
+                    break
+                if new_links_found:
+                    scroll_attempts_no_new = 0 # Reset if new links were found this cycle
+                elif step['atBottom']:
+                    # At the bottom without new links: the feed stopped growing (or is slow to load)
+                    scroll_attempts_no_new += 1
+                    print(f"At the bottom of the feed with no new links. Attempt {scroll_attempts_no_new}/{MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS}")
+                    if scroll_attempts_no_new >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS:
+                        print("Stopping scroll due to lack of new links.")
                         break
 
-                    # Check if scroll height has changed
-                    new_height = await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollHeight') # Added await
-                    if new_height == last_height:
-                        # Check for the "end of results" marker
-                        end_marker_xpath = "//span[contains(text(), \"You've reached the end of the list.\")]"
-                        if await page.locator(end_marker_xpath).count() > 0: # Added await
-                            print("Reached the end of the results list.")
-                            break
-                        else:
-                            # If height didn't change but end marker isn't there, maybe loading issue?
-                            # Increment no-new-links counter
-                            if not new_links_found:
-                                scroll_attempts_no_new += 1
-                                print(f"Scroll height unchanged and no new links. Attempt {scroll_attempts_no_new}/{MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS}")
-                                if scroll_attempts_no_new >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS:
-                                    print("Stopping scroll due to lack of new links.")
-                                    break
-                            else:
-                                scroll_attempts_no_new = 0 # Reset if new links were found this cycle
-                    else:
-                        last_height = new_height
-                        scroll_attempts_no_new = 0 # Reset if scroll height changed
-
-                    # Optional: Add a hard limit on scrolls to prevent infinite loops
-                    # if scroll_count > MAX_SCROLLS: break
-
-            # --- Scraping Individual Places ---
-            print(f"\nScraping details for {len(place_links)} places...")
-            count = 0
-            for link in place_links:
-                count += 1
-                print(f"Processing link {count}/{len(place_links)}: {link}") # Keep sync print
-
-                # Use smart delay algorithm for human-like behavior
-                delay = await smart_delay(count)
-                print(f"  >> Waiting {delay:.1f}s before loading...")
-                await asyncio.sleep(delay)
-
+                # Only a scroll that reached the bottom makes the feed load more results:
+                # wait for them (returns as soon as they render). Mid-feed scrolls just get
+                # the short jitter between scrolls (more human-like)
+                if step['atBottom']:
+                    await wait_for_new_items(page, step['linkCount'])
+                await asyncio.sleep(random.uniform(0.1, 0.3))
+
+                # Occasionally pause longer (15% chance) as if reading something
+                if random.random() < 0.15:
+                    read_pause = random.uniform(1.5, 3.5)
+                    await asyncio.sleep(read_pause)
+
+                # Optional: Add a hard limit on scrolls to prevent infinite loops
+                # if scroll_count > MAX_SCROLLS: break
+
+        # --- Scraping Individual Places ---
+        # The feed page is no longer needed; free it before the detail phase
+        await page.close()
+
+        # Two-stage pipeline: places are fetched over plain HTTP (HTTP_CONCURRENCY at once)
+        # and only places whose raw HTML is incomplete are loaded in the browser
+        # (MAX_CONCURRENCY at once, in reused tabs). If none of the first HTTP_PROBE_PLACES
+        # fetches is complete, the remaining places go straight to the browser.
+        # stealth_mode runs both stages one place at a time (STEALTH_CONCURRENCY).
+        print(f"\nScraping details for {len(place_links)} places...")
+        http_client = get_http_client(lang)
+        http_semaphore = asyncio.Semaphore(STEALTH_CONCURRENCY if stealth_mode else HTTP_CONCURRENCY)
+        browser_semaphore = asyncio.Semaphore(STEALTH_CONCURRENCY if stealth_mode else MAX_CONCURRENCY)
+        detail_pages = asyncio.Queue()
+        place_numbers = itertools.count(1)  # Shared, so fatigue and breaks follow the global count
+        break_over = asyncio.Event()  # Cleared while a stealth_mode break pauses all workers
+        break_over.set()
+        http_stats = {'started': 0, 'attempts': 0, 'complete': 0}  # HTTP stage of this scrape
+        http_probed = asyncio.Event()  # Set once the HTTP stage proved useful or useless
+
+        async def fetch_place(link):
+            place_data = None
+            if use_cache:
                 try:
-                    await page.goto(link, wait_until='domcontentloaded') # Added await
-                    # Wait a bit for dynamic content if needed, or wait for a specific element
-                    # await page.wait_for_load_state('networkidle', timeout=10000) # Or networkidle if needed
-
-                    # Additional small random delay after page load
-                    await asyncio.sleep(random.uniform(0.5, 1.0))
-
-                    html_content = await page.content() # Added await
-                    place_data = extractor.extract_place_data(html_content)
-
-                    if place_data:
-                        place_data['link'] = link # Add the source link
-
-                        # Try to load the business website if it exists
-                        website_url = place_data.get('website', '')
-                        if website_url and website_url not in ['', 'N/A', None]:
-                            print(f"  >> Attempting to access website: {website_url}")
-                            try:
-                                website_status = await try_load_website(page, website_url)
-
-                                if website_status == "accessible":
-                                    print(f"  [OK] Website accessible: {website_url}")
-                                elif website_status == "forbidden":
-                                    print(f"  [FORBIDDEN] Website requires access - marking as 'Potreban pristup'")
-                                    place_data['website'] = 'Potreban pristup'
-                                    place_data['original_website'] = website_url
-                                elif website_status == "timeout":
-                                    print(f"  [TIMEOUT] Website timeout")
-                                    place_data['website'] = 'Timeout'
-                                    place_data['original_website'] = website_url
-                                elif website_status == "error":
-                                    print(f"  [ERROR] Website error")
-                                    place_data['website'] = 'Greška pri učitavanju'
-                                    place_data['original_website'] = website_url
-                            except Exception as e:
-                                # Catch ALL exceptions including ForbiddenException
-                                # This ensures the workflow never stops due to website checking
-                                print(f"  [WARNING] Website check exception (continuing): {type(e).__name__}: {str(e)}")
-                                place_data['website'] = 'Greška pri provjeri'
-                                place_data['original_website'] = website_url
-                                # Continue scraping - don't let website errors stop the workflow
-
-                        results.append(place_data)
-                        # print(json.dumps(place_data, indent=2)) # Optional: print data as it's scraped
-                    else:
-                        print(f"  - Failed to extract data for: {link}")
-                        # Optionally save the HTML for debugging
-                        # with open(f"error_page_{count}.html", "w", encoding="utf-8") as f:
-                        #     f.write(html_content)
-
-                except PlaywrightTimeoutError:
-                    print(f"  - Timeout navigating to or processing: {link}")
-                    # Even on timeout, continue to next place - don't lose all data!
+                    place_data = place_cache.get_place(place_key(link), lang)
                 except Exception as e:
-                    print(f"  - Error processing {link}: {e}")
-                    # Even on error, continue to next place - don't lose all data!
-
-            await browser.close() # Added await
+                    # An unreadable cache only costs a fresh scrape
+                    print(f"  [WARNING] Place cache lookup failed (scraping instead): {type(e).__name__}: {e}")
+            if place_data:
+                print(f"  [CACHE] Using cached details for: {link}")
+                place_data['link'] = link
+            else:
+                async with http_semaphore:
+                    await break_over.wait()
+                    await pace_place(link, next(place_numbers), len(place_links), stealth_mode, break_over)
+                    # The first HTTP_PROBE_PLACES places decide whether the others try HTTP first
+                    if http_stats['started'] >= HTTP_PROBE_PLACES:
+                        await http_probed.wait()
+                    if http_stats['started'] < HTTP_PROBE_PLACES or http_stats['complete']:
+                        http_stats['started'] += 1
+                        try:
+                            place_data = await fetch_place_http(http_client, link)
+                        finally:
+                            # Counted even on errors, so the workers waiting on the probe resume
+                            http_stats['attempts'] += 1
+                            if place_data is not None:
+                                http_stats['complete'] += 1
+                            if http_stats['complete'] or http_stats['attempts'] >= HTTP_PROBE_PLACES:
+                                http_probed.set()
+                if place_data is None:
+                    async with browser_semaphore:
+                        await break_over.wait()
+                        place_data = await scrape_place(context, detail_pages, link)
+                if place_data and use_cache:
+                    # Stored before the website check, so a one-off check failure isn't cached
+                    try:
+                        place_cache.store_place(place_key(link), lang, place_data)
+                    except Exception as e:
+                        print(f"  [WARNING] Could not cache {link} (continuing): {type(e).__name__}: {e}")
+            if place_data:
+                # Checked on every scrape (cached or not), outside the semaphores, so the
+                # website check overlaps with loading the next place
+                await check_place_website(http_client, place_data)
+            return place_data
+
+        place_results = await asyncio.gather(
+            *(fetch_place(link) for link in place_links), return_exceptions=True
+        )
+        for link, place_data in zip(place_links, place_results):
+            if isinstance(place_data, BaseException):
+                print(f"  - Error processing {link}: {type(place_data).__name__}: {place_data}")
+        results = [place_data for place_data in place_results if isinstance(place_data, dict)]
+        print(f"HTTP stage: {http_stats['complete']}/{http_stats['attempts']} fetched places had complete raw HTML.")
 
-        except PlaywrightTimeoutError:
-            print(f"Timeout error during scraping process.")
-        except Exception as e:
-            print(f"An error occurred during scraping: {e}")
-            import traceback
-            traceback.print_exc() # Print detailed traceback for debugging
-        finally:
-            # Ensure browser is closed if an error occurred mid-process
-            if browser and browser.is_connected(): # Check if browser exists and is connected
-                await browser.close() # Added await
+    except PlaywrightTimeoutError:
+        print(f"Timeout error during scraping process.")
+    except Exception as e:
+        print(f"An error occurred during scraping: {e}")
+        import traceback
+        traceback.print_exc() # Print detailed traceback for debugging
+    finally:
+        # Close only this call's page; the shared browser stays up for the next call
+        if page is not None and not page.is_closed():
+            await page.close()
+        while detail_pages is not None and not detail_pages.empty():
+            await detail_pages.get_nowait().close()
 
     print(f"\nScraping finished. Found details for {len(results)} places.")
     return results